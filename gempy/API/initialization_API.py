@@ -116,7 +116,7 @@ def structural_elements_from_borehole_set(
                 names=[name],
                 name_id_map={name: properties['id']}
             ),
-            orientations=OrientationsTable(np.zeros(0, dtype=OrientationsTable.dt))
+            orientations=OrientationsTable.initialize_empty()
         )
         elements.append(element)
     # Reverse the list to have the oldest rocks at the bottom
@@ -11,11 +11,37 @@ def structural_element_hasher(i: int, name: str, hash_length: int = 8) -> int:
 
 
 def generate_ids_from_names(name_id_map, names, x):
-    name_id_map = name_id_map or {name: structural_element_hasher(i, name) for i, name in enumerate(np.unique(names))}
     if isinstance(names, str):
+        name_id_map = name_id_map or {name: structural_element_hasher(i, name) for i, name in enumerate(np.unique(names))}
         ids = np.array([name_id_map[names]] * len(x))
     elif isinstance(names, Sequence) or isinstance(names, np.ndarray):
-        ids = np.array([name_id_map[name] for name in names])
+        unique_names, inverse = np.unique(names, return_inverse=True)
+        name_id_map = name_id_map or {name: structural_element_hasher(i, name) for i, name in enumerate(unique_names)}
+        ids = _unique_names_to_ids(name_id_map, unique_names)[inverse]
     else:
         raise TypeError(f"Names should be a string or a NumPy array, not {type(names)}")
     return ids, name_id_map
+
+
+def map_names_to_ids(name_id_map: dict[str, int], names) -> np.ndarray:
+    """Maps each name to its id. Every distinct name is looked up in ``name_id_map`` only once."""
+    unique_names, inverse = np.unique(names, return_inverse=True)
+    return _unique_names_to_ids(name_id_map, unique_names)[inverse]
+
+
+def _unique_names_to_ids(name_id_map: dict[str, int], unique_names: np.ndarray) -> np.ndarray:
+    return np.array([name_id_map[name] for name in unique_names], dtype=np.int64)
+
+
+def id_runs(sorted_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Finds the contiguous run of each id in already sorted ``sorted_ids``.
+
+    Returns the unique ids and the start and length of each run.
+    """
+    if sorted_ids.size == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return sorted_ids, empty, empty
+
+    starts = np.flatnonzero(np.concatenate(([True], sorted_ids[1:] != sorted_ids[:-1])))
+    counts = np.diff(np.append(starts, sorted_ids.size))
+    return sorted_ids[starts], starts, counts
@@ -1,122 +1,268 @@
-﻿from dataclasses import dataclass
+﻿from dataclasses import dataclass, field
 from typing import Optional, Sequence, Union
 
 import numpy as np
 
-from gempy.core.data._data_points_helpers import generate_ids_from_names
+from gempy.core.data._data_points_helpers import generate_ids_from_names, map_names_to_ids, id_runs
 from gempy_engine.core.data.transforms import Transform
 from gempy.optional_dependencies import require_pandas
 
 DEFAULT_ORI_NUGGET = 0.01
+BLOCK_ALIGNMENT = 64  #: Byte alignment of the large coordinates and gradients blocks built by from_arrays, data and concatenate (a cache line, which also fits AVX loads).
+_ALIGNED_MIN_BYTES = 1 << 16  # * Below this the padded allocation costs more than the aligned loads save
 
 # ? Maybe we should merge this with the SurfacePoints class from gempy_engine
 
 
-@dataclass(init=True)
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+# * Shared zero-length columns for empty tables. Nothing can be written into a size 0 array anyway
+_EMPTY_BLOCK = _read_only(np.zeros((0, 3), dtype=np.float64))
+_EMPTY_IDS = _read_only(np.zeros(0, dtype=np.int32))
+_EMPTY_NUGGET = _read_only(np.zeros(0, dtype=np.float64))
+
+
+def _column(values, dtype, n: int) -> np.ndarray:
+    column = np.ascontiguousarray(values, dtype=dtype)
+    if column.shape != (n,):  # * Scalars (e.g. a single nugget) are broadcast to the whole table
+        column = np.ascontiguousarray(np.broadcast_to(column, (n,)))
+    return column
+
+
+def _aligned_empty(shape: tuple[int, ...], dtype=np.float64) -> np.ndarray:
+    """Like ``np.empty``, but arrays of at least ``_ALIGNED_MIN_BYTES`` start on a :data:`BLOCK_ALIGNMENT` byte boundary."""
+    dtype = np.dtype(dtype)
+    n_bytes = int(np.prod(shape)) * dtype.itemsize
+    if n_bytes < _ALIGNED_MIN_BYTES:
+        return np.empty(shape, dtype=dtype)
+    buffer = np.empty(n_bytes + BLOCK_ALIGNMENT, dtype=np.uint8)
+    offset = -buffer.ctypes.data % BLOCK_ALIGNMENT
+    return buffer[offset:offset + n_bytes].view(dtype).reshape(shape)
+
+
+def _stack_columns(a, b, c, n: int) -> np.ndarray:
+    block = _aligned_empty((n, 3))
+    block[:, 0], block[:, 1], block[:, 2] = a, b, c
+    return block
+
+
+@dataclass
 class OrientationsTable:
     """
     A dataclass to represent a table of orientations in a geological model.
-    
-    """ 
-    data: np.ndarray  #: A structured NumPy array holding the X, Y, Z coordinates, gradients G_x, G_y, G_z, id, and nugget of each orientation.
+
+    The coordinates and gradients are stored as C-contiguous (N, 3) blocks, with the ids and nuggets as separate
+    columns. The structured array representation, with dtype :attr:`dt`, is still available through :attr:`data` for I/O.
+
+    :attr:`xyz`, :attr:`grads` and :attr:`nugget` return the storage itself, so they can be edited in place. The
+    ids are read-only; assign :attr:`data` to change them.
+
+    """
+    _xyz: np.ndarray  #: (N, 3) array with the X, Y, Z coordinates of each orientation.
+    _grads: np.ndarray  #: (N, 3) array with the G_x, G_y, G_z gradient of each orientation.
+    _id: np.ndarray  #: Id of the element each orientation belongs to.
+    _nugget: np.ndarray  #: Nugget effect of each orientation.
+    _n: int  #: Number of orientations.
     name_id_map: Optional[dict[str, int]] = None  #: A mapping between orientation names and ids.
-    
+
     dt = np.dtype([('X', 'f8'), ('Y', 'f8'), ('Z', 'f8'), ('G_x', 'f8'), ('G_y', 'f8'), ('G_z', 'f8'), ('id', 'i4'), ('nugget', 'f8')])  #: The custom data type for the data array.
-    
+
     _model_transform: Optional[Transform] = None
-    
-    def __post_init__(self):
-        # Check if the data array has the correct data type
-        if self.data.dtype != OrientationsTable.dt:
-            raise ValueError(f"Data array must have the following data type: {OrientationsTable.dt}")
-    
+    _id_order_cache: Optional[tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)  #: Stable id sorting permutation and the sorted ids.
+
+    def __init__(self, data: np.ndarray, name_id_map: Optional[dict[str, int]] = None):
+        self.data = data
+        self.name_id_map = name_id_map
+
+    def __setstate__(self, state: dict):
+        # * Used by pickle and copy.deepcopy, which both hand back writable arrays
+        self.__dict__.update(state)
+        self._id.setflags(write=False)
+        self._id_order_cache = None
+
     @classmethod
     def from_arrays(cls, x: np.ndarray, y: np.ndarray, z: np.ndarray,
                     G_x: np.ndarray, G_y: np.ndarray, G_z: np.ndarray,
                     names: Union[Sequence | str], nugget: Optional[np.ndarray] = None,
                     name_id_map: Optional[dict[str, int]] = None) -> 'OrientationsTable':
-
-        data, name_id_map = cls._data_from_arrays(x, y, z, G_x, G_y, G_z, names, nugget, name_id_map)
-        return cls(data, name_id_map)
-
-    @classmethod
-    def _data_from_arrays(cls, x, y, z, G_x, G_y, G_z, names, nugget, name_id_map=None) -> tuple[np.ndarray, dict[str, int]]:
         if nugget is None:
             nugget = np.zeros_like(x) + DEFAULT_ORI_NUGGET
-            
+        else:
+            nugget = np.array(nugget, dtype=np.float64)  # * The nugget column is writable storage, so never the caller's array
+
         if name_id_map is None:
             ids, name_id_map = generate_ids_from_names(name_id_map, names, x)
         else:
-            ids = np.array([name_id_map[name] for name in names])
-        data = np.zeros(len(x), dtype=OrientationsTable.dt)
-        data['X'], data['Y'], data['Z'], data['G_x'], data['G_y'], data['G_z'], data['id'], data['nugget'] = x, y, z, G_x, G_y, G_z, ids, nugget
-        return data, name_id_map
+            ids = map_names_to_ids(name_id_map, names)
+
+        n = np.shape(x)[0] if np.ndim(x) > 0 else 1
+        return cls._from_blocks(_stack_columns(x, y, z, n), _stack_columns(G_x, G_y, G_z, n), ids, nugget, name_id_map)
+
+    @classmethod
+    def _data_from_arrays(cls, x, y, z, G_x, G_y, G_z, names, nugget, name_id_map=None) -> tuple[np.ndarray, dict[str, int]]:
+        orientations = cls.from_arrays(x, y, z, G_x, G_y, G_z, names, nugget, name_id_map)
+        return orientations.data, orientations.name_id_map
+
+    @classmethod
+    def _from_blocks(cls, xyz: np.ndarray, grads: np.ndarray, ids: np.ndarray, nugget: np.ndarray,
+                     name_id_map: Optional[dict[str, int]] = None) -> 'OrientationsTable':
+        orientations = cls.__new__(cls)
+        orientations._set_blocks(xyz, grads, ids, nugget)
+        orientations.name_id_map = name_id_map
+        return orientations
+
+    def _set_blocks(self, xyz: np.ndarray, grads: np.ndarray, ids: np.ndarray, nugget: np.ndarray):
+        self._xyz = np.ascontiguousarray(xyz, dtype=np.float64)
+        self._grads = np.ascontiguousarray(grads, dtype=np.float64)
+        self._n = n = self._xyz.shape[0]  # * The blocks are only replaced here, so the length can be cached
+        self._id = _column(ids, np.int32, n)
+        if self._id.flags.writeable:  # * Lookups by id cache the order of this column
+            if self._id is ids:  # * Not the caller's own array, which must stay writable and could change the ids
+                self._id = ids.copy()
+            self._id.setflags(write=False)
+        self._nugget = _column(nugget, np.float64, n)
+        self._id_order_cache = None
 
     @classmethod
     def initialize_empty(cls) -> 'OrientationsTable':
-        return cls(np.zeros(0, dtype=OrientationsTable.dt))
-    
-    
+        return cls._from_blocks(_EMPTY_BLOCK, _EMPTY_BLOCK, _EMPTY_IDS, _EMPTY_NUGGET)
+
+    @classmethod
+    def concatenate(cls, orientations: Sequence['OrientationsTable'],
+                    name_id_map: Optional[dict[str, int]] = None) -> 'OrientationsTable':
+        """Concatenates several tables, copying each column once into preallocated outputs."""
+        if len(orientations) == 0:
+            empty = cls.initialize_empty()
+            empty.name_id_map = name_id_map
+            return empty
+
+        # * One np.concatenate per column, so the copies of all the tables run in a single C loop
+        n = sum(len(table) for table in orientations)
+        xyz, grads = _aligned_empty((n, 3)), _aligned_empty((n, 3))
+        ids, nugget = np.empty(n, dtype=np.int32), np.empty(n, dtype=np.float64)
+        np.concatenate([table._xyz for table in orientations], out=xyz)
+        np.concatenate([table._grads for table in orientations], out=grads)
+        np.concatenate([table._id for table in orientations], out=ids)
+        np.concatenate([table._nugget for table in orientations], out=nugget)
+        return cls._from_blocks(xyz, grads, _read_only(ids), nugget, name_id_map)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Structured array with dtype :attr:`dt`. It is built from the columns on every access, so it is read-only
+        (writes into it would not reach the table). Edit a ``.copy()`` and assign it back to :attr:`data` instead."""
+        data = np.empty(len(self), dtype=OrientationsTable.dt)
+        data['X'], data['Y'], data['Z'] = self._xyz.T
+        data['G_x'], data['G_y'], data['G_z'] = self._grads.T
+        data['id'], data['nugget'] = self._id, self._nugget
+        data.setflags(write=False)
+        return data
+
+    @data.setter
+    def data(self, value: np.ndarray):
+        # Check if the data array has the correct data type
+        if value.dtype != OrientationsTable.dt:
+            raise ValueError(f"Data array must have the following data type: {OrientationsTable.dt}")
+        n = len(value)
+        self._set_blocks(
+            xyz=_stack_columns(value['X'], value['Y'], value['Z'], n),
+            grads=_stack_columns(value['G_x'], value['G_y'], value['G_z'], n),
+            ids=value['id'],
+            nugget=np.array(value['nugget'], dtype=np.float64)  # * A single row field is contiguous, so it would be a view of value
+        )
+
     @property
     def xyz(self) -> np.ndarray:
-        return np.array([self.data['X'], self.data['Y'], self.data['Z']]).T
-    
+        """(N, 3) C-contiguous coordinates. This is the table storage, not a copy, so writes into it modify the table."""
+        return self._xyz
+
     @property
     def grads(self) -> np.ndarray:
-        return np.array([self.data['G_x'], self.data['G_y'], self.data['G_z']]).T
-    
+        """(N, 3) C-contiguous gradients. This is the table storage, not a copy, so writes into it modify the table."""
+        return self._grads
+
     @property
     def nugget(self) -> np.ndarray:
-        return self.data['nugget']
+        """Nugget column. This is the table storage, not a copy, so writes into it modify the table."""
+        return self._nugget
 
     @property
     def ids(self) -> np.ndarray:
-        return self.data['id']
-    
+        """Read-only ids column. Lookups by id cache its sorting, so change the ids by assigning :attr:`data`."""
+        return self._id
+
     def get_orientations_by_name(self, name: str) -> 'OrientationsTable':
         return self.get_orientations_by_id(self.name_id_map[name])
 
     def get_orientations_by_id(self, id: int) -> 'OrientationsTable':
-        return OrientationsTable(self.data[self.data['id'] == id], self.name_id_map)
-    
+        # * The rows of an id are a contiguous run of the id-sorted order, found by binary search
+        order, sorted_ids = self._id_order
+        start, stop = np.searchsorted(sorted_ids, id, side='left'), np.searchsorted(sorted_ids, id, side='right')
+        return self._take(order[start:stop])
+
     def get_orientations_by_id_groups(self) -> list['OrientationsTable']:
-        ids = np.unique(self.data['id'])
-        return [self.get_orientations_by_id(id) for id in ids]
+        # * One gather into id order, after which every group is a contiguous slice of it
+        order, sorted_ids = self._id_order
+        _, starts, counts = id_runs(sorted_ids)
+        sorted_table = self._take(order)
+        return [sorted_table._slice(start, start + count) for start, count in zip(starts, counts)]
+
+    @property
+    def _id_order(self) -> tuple[np.ndarray, np.ndarray]:
+        """Stable permutation that sorts the rows by id, and the sorted ids. Computed once per change of the columns."""
+        if self._id_order_cache is None:
+            order = np.argsort(self._id, kind='stable')
+            self._id_order_cache = (order, self._id[order])
+        return self._id_order_cache
+
+    def _take(self, rows: np.ndarray) -> 'OrientationsTable':
+        """Returns a new table with the given ``rows`` (integer indices)."""
+        return OrientationsTable._from_blocks(self._xyz[rows], self._grads[rows], _read_only(self._id[rows]), self._nugget[rows], self.name_id_map)
+
+    def _slice(self, start: int, stop: int) -> 'OrientationsTable':
+        """Returns a new table with views of the rows ``start:stop``."""
+        return OrientationsTable._from_blocks(self._xyz[start:stop], self._grads[start:stop], self._id[start:stop], self._nugget[start:stop], self.name_id_map)
 
     @classmethod
     def fill_missing_orientations_groups(cls, orientations_groups: list['OrientationsTable'],
                                          surface_points_groups: list['SurfacePointsTable']) -> list['OrientationsTable']:
         # region Deal with elements without orientations
         if len(surface_points_groups) > len(orientations_groups):
-            # Check the ids of the surface points and find the missing ones
-            surface_points_ids = [surface_points_group.id for surface_points_group in surface_points_groups]
-            orientations_ids = [orientations_group.id for orientations_group in orientations_groups]
-
-            missing_ids = list(set(surface_points_ids) - set(orientations_ids))
+            # Check the ids of the surface points and find the missing ones (sorted)
+            surface_points_ids = np.fromiter((group.id for group in surface_points_groups), dtype=np.int32, count=len(surface_points_groups))
+            orientations_ids = np.fromiter((group.id for group in orientations_groups), dtype=np.int32, count=len(orientations_groups))
+            missing_ids = np.setdiff1d(surface_points_ids, orientations_ids)  # * assume_unique=True would not sort them
 
-            empty_orientations = [cls(data=np.zeros(0, dtype=cls.dt)) for id in missing_ids] # Create empty orientations
+            # * Same positions as inserting the empty orientations one by one at index id (or at the end when id is
+            # * past it): later, larger ids never shift the earlier ones, so each slot is known upfront
+            filled_groups: list[Optional[OrientationsTable]] = [None] * (len(orientations_groups) + len(missing_ids))
+            for inserted, id in enumerate(missing_ids.tolist()):
+                filled_groups[min(id, len(orientations_groups) + inserted)] = cls.initialize_empty()
 
-            for empty_orientation, id in zip(empty_orientations, missing_ids): # Insert the empty orientations in the right position
-                orientations_groups.insert(id, empty_orientation)
+            existing_groups = iter(orientations_groups)
+            orientations_groups = [group if group is not None else next(existing_groups) for group in filled_groups]
         # endregion
 
         return orientations_groups
     
     @classmethod
     def empty_orientation(cls, id: int) -> 'OrientationsTable':
-        zeros = np.zeros(0, dtype=cls.dt)
-        zeros['id'] = id
-        return cls(data=zeros, name_id_map={})
+        empty = cls.initialize_empty()
+        empty.name_id_map = {}
+        return empty
     
     @property
     def id(self) -> int:
         # Check id is the same in the whole column and return it or throw an error
-        ids = np.unique(self.data['id'])
-        if len(ids) > 1:
-            raise ValueError(f"OrientationsTable contains more than one id: {ids}")
-        if len(ids) == 0:
+        ids = self._id
+        if ids.size == 0:
             raise ValueError(f"OrientationsTable contains no ids")
-        return ids[0]
+        first_id = ids[0]
+        if (ids != first_id).any():
+            raise ValueError(f"OrientationsTable contains more than one id: {np.unique(ids)}")
+        return first_id
 
     @property
     def model_transform(self) -> Transform:
@@ -131,7 +277,18 @@ class OrientationsTable:
     @property
     def df(self) -> 'pd.DataFrame':
         pd = require_pandas()
-        return pd.DataFrame(self.data)
+        # * Built from the columns, without going through the structured array. pandas copies them, so the DataFrame
+        # * does not share memory with the table
+        return pd.DataFrame({
+            'X'     : self._xyz[:, 0],
+            'Y'     : self._xyz[:, 1],
+            'Z'     : self._xyz[:, 2],
+            'G_x'   : self._grads[:, 0],
+            'G_y'   : self._grads[:, 1],
+            'G_z'   : self._grads[:, 2],
+            'id'    : self._id,
+            'nugget': self._nugget
+        })
 
     def __str__(self):
         return "\n" + np.array2string(self.data, precision=2, separator=',', suppress_small=True)
@@ -143,18 +300,19 @@ class OrientationsTable:
         rows_to_display = 10  # Define the number of rows to display from beginning and end
         html = "<table>"
         html += "<tr><th>X</th><th>Y</th><th>Z</th><th>G_x</th><th>G_y</th><th>G_z</th><th>id</th><th>nugget</th></tr>"
-        if len(self.data) > 2 * rows_to_display:
-            for point in self.data[:rows_to_display]:
+        data = self.data
+        if len(data) > 2 * rows_to_display:
+            for point in data[:rows_to_display]:
                 html += "<tr><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{}</td><td>{:.2f}</td></tr>".format(*point)
             html += "<tr><td>...</td><td>...</td><td>...</td><td>...</td><td>...</td><td>...</td><td>...</td><td>...</td></tr>"
-            for point in self.data[-rows_to_display:]:
+            for point in data[-rows_to_display:]:
                 html += "<tr><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{}</td><td>{:.2f}</td></tr>".format(*point)
         else:
-            for point in self.data:
+            for point in data:
                 html += "<tr><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{:.2f}</td><td>{}</td><td>{:.2f}</td></tr>".format(*point)
         html += "</table>"
         return html
 
     def __len__(self):
-        return len(self.data)
+        return self._n
 
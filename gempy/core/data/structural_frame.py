@@ -27,10 +27,29 @@ class StructuralFrame:
     # ? Should I create some sort of structural options class? For example, the masking descriptor and faults relations pointer
     is_dirty: bool = True  #: Boolean flag indicating if the structural frame has been modified.
 
+    _elements_cache: Optional[list[StructuralElement]] = field(default=None, init=False, repr=False, compare=False)  #: Cached result of ``structural_elements``.
+    _elements_cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)  #: Elements (and colors) the cache was built from.
+    _basement_cache: Optional[StructuralElement] = field(default=None, init=False, repr=False, compare=False)  #: Basement element reused between rebuilds.
+    _fault_relations_cache: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)  #: Cached (read-only) result of ``fault_relations``.
+    _fault_relations_cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)  #: Groups and relations the fault relations were computed from.
+
     def __init__(self, structural_groups: list[StructuralGroup], color_gen: ColorsGenerator):
         self.structural_groups = structural_groups  # ? This maybe could be optional
         self.color_generator = color_gen
 
+        self._elements_cache = None
+        self._elements_cache_key = None
+        self._basement_cache = None
+        self._fault_relations_cache = None
+        self._fault_relations_cache_key = None
+
+    def invalidate(self):
+        """Drops the cached structural elements and fault relations so they are rebuilt on the next access."""
+        self._elements_cache = None
+        self._elements_cache_key = None
+        self._fault_relations_cache = None
+        self._fault_relations_cache_key = None
+
     def get_element_by_name(self, element_name: str) -> StructuralElement:
         elements: Generator = (group.get_element_by_name(element_name) for group in self.structural_groups)
         valid_elements: Generator = (element for element in elements if element is not None)
@@ -56,9 +75,11 @@ class StructuralFrame:
 
     def append_group(self, group: StructuralGroup):
         self.structural_groups.append(group)
+        self.invalidate()
 
     def insert_group(self, index: int, group: StructuralGroup):
         self.structural_groups.insert(index, group)
+        self.invalidate()
 
     @classmethod
     def from_data_tables(cls, surface_points: SurfacePointsTable, orientations: OrientationsTable):
@@ -121,7 +142,8 @@ class StructuralFrame:
 
     def __repr__(self):
         structural_groups_repr = ',\n'.join([repr(g) for g in self.structural_groups])
-        fault_relations_str = np.array2string(self.fault_relations, precision=2, separator=', ', suppress_small=True) if self.fault_relations is not None else 'None'
+        # * Without fault groups there is nothing to show, so the matrix is not computed
+        fault_relations_str = np.array2string(self.fault_relations, precision=2, separator=', ', suppress_small=True) if self._has_fault_groups else 'None'
         return (f"StructuralFrame(\n"
                 f"\tstructural_groups=[\n{structural_groups_repr}\n],\n"
                 f"\tfault_relations=\n{fault_relations_str},\n"
@@ -129,11 +151,11 @@ class StructuralFrame:
 
     def _repr_html_(self):
         structural_groups_html = '<br>'.join([g._repr_html_() for g in self.structural_groups])
-        if self.fault_relations is not None:
-            # Define the colors for True and False values
-            true_color = '#527682'
-            false_color = '#FFB6C1'
+        # Define the colors for True and False values
+        true_color = '#527682'
+        false_color = '#FFB6C1'
 
+        if self._has_fault_groups:
             table_headers = '<th></th>' + ''.join('<th style="transform: rotate(-35deg); height:150px; vertical-align: bottom; text-align: center;">{}</th>'.format((g.name[:10] + '...') if len(g.name) > 10 else g.name) for g in self.structural_groups)
             table_rows = ''.join('<tr><th>{}</th>{}</tr>'.format(self.structural_groups[i].name, ''.join('<td style="background-color: {}; width: 20px; height: 20px; border: 1px solid black;"></td>'.format(true_color if cell else false_color) for cell in row)) for i, row in enumerate(self.fault_relations))
             fault_relations_str = '<table style="border-collapse: collapse; table-layout: fixed;">{}{}</table>'.format(table_headers, table_rows)
@@ -161,12 +183,21 @@ class StructuralFrame:
 
     @property
     def structural_elements(self) -> list[StructuralElement]:
-        """Returns a list of all structural elements across the structural groups."""
+        """Returns a list of all structural elements across the structural groups.
+
+        The list is cached. Groups and elements are often edited in place (e.g. ``group.elements.append``) without
+        going through the frame, so the cache is checked against the current elements and their colors on each access.
+        """
         elements = []
         for group in self.structural_groups:
             elements.extend(group.elements)
-        elements.append(self._basement_element)
-        return elements
+
+        elements_key = tuple((id(element), element.color) for element in elements)
+        if self._elements_cache is None or (self.basement_color, elements_key) != self._elements_cache_key:
+            elements.append(self._basement_element)  # * This can change the basement color
+            self._elements_cache = elements
+            self._elements_cache_key = (self.basement_color, elements_key)
+        return self._elements_cache
     
     @property
     def n_elements(self) -> int:
@@ -190,72 +221,110 @@ class StructuralFrame:
             warnings.warn(f"The basement color was already used in the structural elements."
                           f"Changing the basement color to {self.basement_color}.")
         
-        basement = StructuralElement(
-            name="basement",
-            surface_points=SurfacePointsTable(data=np.zeros(0, dtype=SurfacePointsTable.dt)),
-            orientations=OrientationsTable(data=np.zeros(0, dtype=OrientationsTable.dt)),
-            color=self.basement_color
-        )
+        if self._basement_cache is None:
+            self._basement_cache = StructuralElement(
+                name="basement",
+                surface_points=SurfacePointsTable.initialize_empty(),
+                orientations=OrientationsTable.initialize_empty(),
+                color=self.basement_color
+            )
+        else:
+            self._basement_cache.color = self.basement_color
 
-        return basement
+        return self._basement_cache
 
     # ? Should I move this property to StructuralGroup?
     @property
     def fault_relations(self) -> np.ndarray:
-        """Returns a  array describing the fault relations between the structural groups."""
+        """Returns a  array describing the fault relations between the structural groups.
+
+        The array is read-only and cached until the groups, their structural relations or their fault relations change.
+        """
+        fault_relations_key = self._fault_relations_key()
+        if self._fault_relations_cache is not None and fault_relations_key == self._fault_relations_cache_key:
+            return self._fault_relations_cache
+
         # Initialize an empty boolean array with dimensions len(structural_groups) x len(structural_groups)
+        n_groups = len(self.structural_groups)
+        fault_relations = np.zeros((n_groups, n_groups), dtype=bool)
+
+        # * Only faults can offset other groups, so the rest of the groups are never visited
+        fault_mask = np.fromiter(
+            (group.structural_relation is StackRelationType.FAULT for group in self.structural_groups),
+            dtype=bool,
+            count=n_groups
+        )
 
-        fault_relations = np.zeros((len(self.structural_groups), len(self.structural_groups)), dtype=bool)
+        # * Position of each group, so specific fault relations do not need a list.index per affected group
+        group_to_idx: dict[int, int] = {id(g): j for j, g in enumerate(self.structural_groups)}
 
         # We assume that the list is ordered from older to younger
-        # Iterate over the list of structural_groups
-        for i, group in enumerate(self.structural_groups):
-            match (group.structural_relation, group.fault_relations):
-                case (StackRelationType.FAULT, FaultsRelationSpecialCase.OFFSET_ALL):  # It affects all younger groups
+        # Iterate over the faults of the list of structural_groups
+        for i in np.flatnonzero(fault_mask).tolist():
+            group = self.structural_groups[i]
+            match group.fault_relations:
+                case FaultsRelationSpecialCase.OFFSET_ALL:  # It affects all younger groups
                     fault_relations[i, i + 1:] = True
-                case (StackRelationType.FAULT, FaultsRelationSpecialCase.OFFSET_NONE):  # It affects no groups
+                case FaultsRelationSpecialCase.OFFSET_NONE:  # It affects no groups
                     pass
-                case (StackRelationType.FAULT, FaultsRelationSpecialCase.OFFSET_FORMATIONS):  # It affects all younger groups that are formations
-                    do_offset = []
-                    for group_internal in self.structural_groups[i + 1:]:
-                        do_offset.append(group_internal.structural_relation != StackRelationType.FAULT)
-                    fault_relations[i, i + 1:] = do_offset
-                case (StackRelationType.FAULT, list(fault_groups)) if fault_groups:  # It affects only the specified groups
+                case FaultsRelationSpecialCase.OFFSET_FORMATIONS:  # It affects all younger groups that are formations
+                    fault_relations[i, i + 1:] = ~fault_mask[i + 1:]
+                case list(fault_groups) if fault_groups:  # It affects only the specified groups
                     for fault_group in fault_groups:
-                        j = self.structural_groups.index(fault_group)
+                        j = group_to_idx.get(id(fault_group))
+                        if j is None:  # * Not the same object (e.g. a copy), fall back to equality
+                            j = self.structural_groups.index(fault_group)
                         if j <= i:  # Only consider groups that are 
                             raise ValueError(f"Fault {group.name} cannot affect older fault {fault_group.name}")
-                case (StackRelationType.FAULT, _):
-                    raise ValueError(f"Fault {group.name} has an invalid fault relation")
                 case _:
-                    pass  # If not a fault or fault relation is not specified, do nothing
+                    raise ValueError(f"Fault {group.name} has an invalid fault relation")
+
+        fault_relations.setflags(write=False)
+        self._fault_relations_cache = fault_relations
+        self._fault_relations_cache_key = fault_relations_key
         return fault_relations
 
+    def _fault_relations_key(self) -> tuple:
+        """Everything ``fault_relations`` depends on: the order of the groups, their relation and their fault relations."""
+        def _group_relations_key(group: StructuralGroup):
+            if isinstance(group.fault_relations, list):
+                return tuple(id(fault_group) for fault_group in group.fault_relations)
+            return group.fault_relations
+
+        return tuple((id(group), group.structural_relation, _group_relations_key(group)) for group in self.structural_groups)
+
     @fault_relations.setter
     def fault_relations(self, matrix: np.ndarray):
         """Sets the fault relations between structural groups using the provided matrix."""
-        assert matrix.shape == (len(self.structural_groups), len(self.structural_groups))
+        n_groups = len(self.structural_groups)
+        assert matrix.shape == (n_groups, n_groups)
+
+        # * Row-wise reductions over the younger groups (upper triangle) of the whole matrix at once
+        matrix = np.asarray(matrix, dtype=bool)
+        younger_affected = np.triu(matrix, k=1)
+        all_younger_groups_affected = younger_affected.sum(axis=1) == (n_groups - 1 - np.arange(n_groups))
+        any_younger_groups_affected = younger_affected.any(axis=1)
 
         # Iterate over each StructuralGroup
         for i, group in enumerate(self.structural_groups):
-
-            affected_groups = matrix[i, :]  # * If the group is a fault
-            # If all younger groups are affected
-            all_younger_groups_affected = np.all(affected_groups[i + 1:])
-            any_younger_groups_affected = np.any(affected_groups[i + 1:])
-
-            if all_younger_groups_affected:
+            if all_younger_groups_affected[i]:
                 group.fault_relations = FaultsRelationSpecialCase.OFFSET_ALL
-            elif not any_younger_groups_affected:
+            elif not any_younger_groups_affected[i]:
                 group.fault_relations = FaultsRelationSpecialCase.OFFSET_NONE
             else:  # * A specific set of groups are affected
-                group.fault_relations = [g for j, g in enumerate(self.structural_groups) if affected_groups[j]]
+                group.fault_relations = [self.structural_groups[j] for j in np.flatnonzero(matrix[i])]
+
+        self.invalidate()
     
     @property
     def group_is_fault(self) -> list[bool]:
         """Returns a list of booleans indicating if each structural element is a fault."""
         return [group.is_fault for group in self.structural_groups]
     
+    @property
+    def _has_fault_groups(self) -> bool:
+        return any(group.structural_relation == StackRelationType.FAULT for group in self.structural_groups)
+
     @property
     def group_is_lithology(self) -> list[bool]:
         """Returns a list of booleans indicating if each structural element is a lithology."""
@@ -291,22 +360,23 @@ class StructuralFrame:
     @property
     def number_of_points_per_element(self) -> np.ndarray:
         """Returns an array with the number of points for each structural element."""
-        return np.array([element.number_of_points for element in self.structural_elements])
+        elements = self.structural_elements
+        return np.fromiter((len(element.surface_points) for element in elements), dtype=np.int32, count=len(elements))
 
     @property
     def number_of_points_per_group(self) -> np.ndarray:
         """Returns an array with the number of points for each structural group."""
-        return np.array([group.number_of_points for group in self.structural_groups])
+        return np.fromiter((group.number_of_points for group in self.structural_groups), dtype=np.int32, count=len(self.structural_groups))
 
     @property
     def number_of_orientations_per_group(self) -> np.ndarray:
         """Returns an array with the number of orientations for each structural group."""
-        return np.array([group.number_of_orientations for group in self.structural_groups])
+        return np.fromiter((group.number_of_orientations for group in self.structural_groups), dtype=np.int32, count=len(self.structural_groups))
 
     @property
     def number_of_elements_per_group(self) -> np.ndarray:
         """Returns an array with the number of elements for each structural group."""
-        return np.array([group.number_of_elements for group in self.structural_groups])
+        return np.fromiter((group.number_of_elements for group in self.structural_groups), dtype=np.int32, count=len(self.structural_groups))
 
     @property
     def surfaces(self) -> list[StructuralElement]:
@@ -331,7 +401,9 @@ class StructuralFrame:
     @property
     def surface_points_copy(self) -> SurfacePointsTable:
         """Returns a SurfacePointsTable for all surface points across the structural elements. This is a copy!"""
-        all_data: np.ndarray = np.concatenate([element.surface_points.data for element in self.structural_elements])
+        # * Copy all the elements straight into a preallocated buffer in one call
+        all_data: np.ndarray = np.empty(self.number_of_points_per_element.sum(), dtype=SurfacePointsTable.dt)
+        np.concatenate([element.surface_points.data for element in self.structural_elements], out=all_data)
         return SurfacePointsTable(data=all_data, name_id_map=self.element_name_id_map)
 
     @property
@@ -351,8 +423,7 @@ class StructuralFrame:
     @property
     def orientations_copy(self) -> OrientationsTable:
         """Returns an OrientationsTable for all orientations across the structural elements."""
-        all_data: np.ndarray = np.concatenate([element.orientations.data for element in self.structural_elements])
-        return OrientationsTable(data=all_data)
+        return OrientationsTable.concatenate([element.orientations for element in self.structural_elements])
 
     @property
     def orientations(self) -> OrientationsTable:
@@ -363,9 +434,10 @@ class StructuralFrame:
     def orientations(self, modified_orientations: OrientationsTable) -> None:
         """Distributes the modified orientations back to the structural elements."""
         start = 0
+        modified_data = modified_orientations.data
         for element in self.structural_elements:
-            length = len(element.orientations.data)
-            element.orientations.data = modified_orientations.data[start:start + length]
+            length = len(element.orientations)
+            element.orientations.data = modified_data[start:start + length]
             start += length
 
     @property
@@ -406,13 +478,16 @@ class StructuralFrame:
     @property
     def surface_points_colors_per_item(self) -> list[str]:
         """Returns a list of colors assigned to each surface point across structural elements. Used in matplotlib"""
-        surface_points_colors = [element.color for element in self.structural_elements for _ in range(element.number_of_points)]
+        colors = np.array([element.color for element in self.structural_elements], dtype=object)
+        surface_points_colors = np.repeat(colors, self.number_of_points_per_element).tolist()
         return surface_points_colors
 
     @property
     def orientations_colors_per_item(self) -> list[str]:
         """Returns a list of colors assigned to each orientation across structural elements. Used in matplotlib"""
-        orientations_colors = [element.color for element in self.structural_elements for _ in range(element.number_of_orientations)]
+        colors = np.array([element.color for element in self.structural_elements], dtype=object)
+        number_of_orientations_per_element = np.fromiter((len(element.orientations) for element in self.structural_elements), dtype=np.int32, count=len(colors))
+        orientations_colors = np.repeat(colors, number_of_orientations_per_element).tolist()
         return orientations_colors
 
     @property
@@ -439,8 +514,9 @@ class StructuralFrame:
         """Check that if there are any StackRelationType.FAULT in the structural groups the fault relation matrix is
         given and shape is the right one, i.e. a square matrix of size equals to len(groups)"""
 
-        if any([group.structural_relation == StackRelationType.FAULT for group in self.structural_groups]):
-            if self.fault_relations is None:
+        if self._has_fault_groups:
+            fault_relations = self.fault_relations
+            if fault_relations is None:
                 raise ValueError("The fault relations matrix is not given")
-            if self.fault_relations.shape != (len(self.structural_groups), len(self.structural_groups)):
+            if fault_relations.shape != (len(self.structural_groups), len(self.structural_groups)):
                 raise ValueError("The fault relations matrix is not the right shape")
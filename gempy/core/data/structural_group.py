@@ -80,11 +80,11 @@ class StructuralGroup(ABC):
     
     @property
     def number_of_points(self) -> int:
-        return sum([element.number_of_points for element in self.elements])
+        return sum(len(element.surface_points) for element in self.elements)
     
     @property
     def number_of_orientations(self) -> int:
-        return sum([element.number_of_orientations for element in self.elements])
+        return sum(len(element.orientations) for element in self.elements)
     
     @property
     def number_of_elements(self) -> int:
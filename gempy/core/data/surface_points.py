@@ -2,7 +2,7 @@
 from typing import Optional, Union, Sequence
 import numpy as np
 
-from gempy.core.data._data_points_helpers import generate_ids_from_names
+from gempy.core.data._data_points_helpers import generate_ids_from_names, map_names_to_ids
 from gempy_engine.core.data.transforms import Transform
 from gempy.optional_dependencies import require_pandas
 
@@ -71,7 +71,7 @@ class SurfacePointsTable:
         if name_id_map is None:
             ids, name_id_map = generate_ids_from_names(name_id_map, names, x)
         else:
-            ids = np.array([name_id_map[name] for name in names])
+            ids = map_names_to_ids(name_id_map, names)
             
         data = np.zeros(len(x), dtype=SurfacePointsTable.dt)
         data['X'], data['Y'], data['Z'], data['id'], data['nugget'] = x, y, z, ids, nugget
@@ -127,12 +127,13 @@ class SurfacePointsTable:
     @property
     def id(self) -> int:
         # Check id is the same in the whole column and return it or throw an error
-        ids = np.unique(self.data['id'])
-        if len(ids) > 1:
-            raise ValueError(f"OrientationsTable contains more than one id: {ids}")
-        if len(ids) == 0:
+        ids = self.data['id']
+        if ids.size == 0:
             raise ValueError(f"OrientationsTable contains no ids")
-        return ids[0]
+        first_id = ids[0]
+        if (ids != first_id).any():
+            raise ValueError(f"OrientationsTable contains more than one id: {np.unique(ids)}")
+        return first_id
 
     @property
     def df(self) -> 'pd.DataFrame':
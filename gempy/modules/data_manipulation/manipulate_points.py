@@ -155,6 +155,7 @@ def modify_orientations(geo_model: GeoModel, slice: Optional[Union[int, slice]]
     """
 
     orientations = geo_model.structural_frame.orientations
+    data = orientations.data.copy()  # * orientations.data is read-only, so edit a copy and assign it back at the end
 
     # If no slice is provided, target all rows; else, target specified slice
     target_rows = slice if slice is not None else np.s_[:]
@@ -166,9 +167,9 @@ def modify_orientations(geo_model: GeoModel, slice: Optional[Union[int, slice]]
 
     # Update all the other fields
     for key, value in orientation_field.items():
-        if isinstance(value, np.ndarray) and len(value) != len(orientations.data[target_rows]):
-            raise ValueError(f"Length mismatch: Expected size {len(orientations.data[target_rows])} for field {key}, but got {len(value)}.")
-        orientations.data[key][target_rows] = value
+        if isinstance(value, np.ndarray) and len(value) != len(data[target_rows]):
+            raise ValueError(f"Length mismatch: Expected size {len(data[target_rows])} for field {key}, but got {len(value)}.")
+        data[key][target_rows] = value
 
     # Check if azimuth, dip, or polarity are provided
     any_polar_fields = azimuth is not None or dip is not None or polarity is not None
@@ -178,29 +179,30 @@ def modify_orientations(geo_model: GeoModel, slice: Optional[Union[int, slice]]
         case (True, True):
             # All polar fields provided, convert to gradients
             gx, gy, gz = convert_orientation_to_pole_vector(np.asarray(azimuth), np.asarray(dip), np.asarray(polarity))
-            orientations.data['G_x'][target_rows] = gx
-            orientations.data['G_y'][target_rows] = gy
-            orientations.data['G_z'][target_rows] = gz
+            data['G_x'][target_rows] = gx
+            data['G_y'][target_rows] = gy
+            data['G_z'][target_rows] = gz
 
         case (True, False):
             # Some polar fields missing, compute missing fields from gradients
             prev_azimuth, prev_dip, prev_polarity = compute_adp_from_gradients(
-                orientations.data['G_x'],
-                orientations.data['G_y'],
-                orientations.data['G_z']
+                data['G_x'],
+                data['G_y'],
+                data['G_z']
             )
             azimuth = np.asarray(azimuth) if azimuth is not None else prev_azimuth
             dip = np.asarray(dip) if dip is not None else prev_dip
             polarity = np.asarray(polarity) if polarity is not None else prev_polarity
 
             gradients = convert_orientation_to_pole_vector(azimuth, dip, polarity)
-            orientations.data['G_x'][target_rows] = gradients[:, 0]
-            orientations.data['G_y'][target_rows] = gradients[:, 1]
-            orientations.data['G_z'][target_rows] = gradients[:, 2]
+            data['G_x'][target_rows] = gradients[:, 0]
+            data['G_y'][target_rows] = gradients[:, 1]
+            data['G_z'][target_rows] = gradients[:, 2]
 
         case (_, _):
             pass
 
+    orientations.data = data
     geo_model.orientations = orientations
     return geo_model.structural_frame
 
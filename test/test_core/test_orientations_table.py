@@ -0,0 +1,129 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from gempy.core.data import OrientationsTable, SurfacePointsTable
+from gempy.core.data.orientations import BLOCK_ALIGNMENT
+
+
+def _create_orientations() -> OrientationsTable:
+    return OrientationsTable.from_arrays(
+        x=np.array([1., 2., 3., 4.]),
+        y=np.array([5., 6., 7., 8.]),
+        z=np.array([9., 10., 11., 12.]),
+        G_x=np.array([.1, .2, .3, .4]),
+        G_y=np.zeros(4),
+        G_z=np.ones(4),
+        names=['b', 'a', 'b', 'c']
+    )
+
+
+def test_orientations_table_columns():
+    orientations = _create_orientations()
+
+    np.testing.assert_array_equal(orientations.xyz, [[1, 5, 9], [2, 6, 10], [3, 7, 11], [4, 8, 12]])
+    np.testing.assert_array_equal(orientations.grads[:, 0], [.1, .2, .3, .4])
+    assert orientations.xyz.flags.c_contiguous and orientations.grads.flags.c_contiguous
+    assert orientations.ids.dtype == np.int32
+    with pytest.raises(ValueError):
+        orientations.ids[0] = 1  # * Lookups by id cache the id order, so the ids cannot be edited in place
+    np.testing.assert_array_equal(orientations.nugget, np.full(4, 0.01))
+
+    # * The structured array round trips through the columns
+    assert orientations.data.dtype == OrientationsTable.dt
+    with pytest.raises(ValueError):
+        orientations.data['G_y'][0] = 1  # * data is built on access, so it is read-only instead of silently dropping writes
+    data = orientations.data.copy()
+    data['G_y'] = 1
+    np.testing.assert_array_equal(orientations.grads[:, 1], 0)
+    orientations.data = data
+    np.testing.assert_array_equal(orientations.grads[:, 1], 1)
+
+    # * The nugget is writable storage of its own, never the caller's array
+    nugget = np.full(4, 0.5)
+    orientations = OrientationsTable.from_arrays(x=np.zeros(4), y=np.zeros(4), z=np.zeros(4), G_x=np.zeros(4),
+                                                 G_y=np.zeros(4), G_z=np.ones(4), names='a', nugget=nugget)
+    orientations.nugget[0] = 99
+    np.testing.assert_array_equal(nugget, 0.5)
+    single = orientations.data[:1].copy()
+    orientations = OrientationsTable(single)
+    orientations.nugget[0] = 42
+    assert single['nugget'][0] == 99
+
+
+def test_orientations_table_by_id():
+    orientations = _create_orientations()
+
+    b = orientations.get_orientations_by_name('b')
+    assert len(b) == 2
+    assert b.id == orientations.name_id_map['b']
+    np.testing.assert_array_equal(b.xyz[:, 0], [1, 3])
+
+    # * xyz is the writable table storage, and lookups by id only cache the id order, so in-place edits are seen
+    orientations.xyz[2, 0] = 30
+    np.testing.assert_array_equal(orientations.get_orientations_by_name('b').xyz[:, 0], [1, 30])
+
+    groups = orientations.get_orientations_by_id_groups()
+    assert sum(len(group) for group in groups) == len(orientations)
+    assert [group.id for group in groups] == sorted(orientations.name_id_map.values())
+
+
+def test_orientations_table_copies_keep_ids_read_only():
+    orientations = _create_orientations()
+    orientations.get_orientations_by_name('b')  # * Fills the id order cache
+
+    for copied in (copy.deepcopy(orientations), pickle.loads(pickle.dumps(orientations))):
+        with pytest.raises(ValueError):
+            copied.ids[0] = 1
+        np.testing.assert_array_equal(copied.ids, orientations.ids)
+        np.testing.assert_array_equal(copied.get_orientations_by_name('b').xyz[:, 0], [1, 3])
+        copied.xyz[0, 0] = 10
+        assert orientations.xyz[0, 0] == 1
+
+
+def test_orientations_table_large_blocks_aligned():
+    n = 10_000
+    orientations = OrientationsTable.from_arrays(
+        x=np.arange(n, dtype=float), y=np.zeros(n), z=np.zeros(n), G_x=np.zeros(n), G_y=np.zeros(n), G_z=np.ones(n),
+        names=np.where(np.arange(n) % 2, 'a', 'b')
+    )
+    merged = OrientationsTable.concatenate(orientations.get_orientations_by_id_groups())
+    for table in (orientations, merged):
+        assert table.xyz.ctypes.data % BLOCK_ALIGNMENT == 0 and table.grads.ctypes.data % BLOCK_ALIGNMENT == 0
+    assert len(merged) == n
+
+
+def test_orientations_table_ids_from_names():
+    orientations = _create_orientations()
+    name_id_map = orientations.name_id_map
+    np.testing.assert_array_equal(orientations.ids, [name_id_map['b'], name_id_map['a'], name_id_map['b'], name_id_map['c']])
+
+    mapped = OrientationsTable.from_arrays(
+        x=np.zeros(3), y=np.zeros(3), z=np.zeros(3), G_x=np.zeros(3), G_y=np.zeros(3), G_z=np.ones(3),
+        names=np.array(['s', 'r', 's']), name_id_map={'r': 7, 's': 3}
+    )
+    np.testing.assert_array_equal(mapped.ids, [3, 7, 3])
+
+
+def test_orientations_table_fill_missing_groups():
+    surface_points_groups = [
+        SurfacePointsTable.from_arrays(x=np.zeros(1), y=np.zeros(1), z=np.zeros(1), names='s', name_id_map={'s': i})
+        for i in range(6)
+    ]
+    orientations_groups = [
+        OrientationsTable.from_arrays(x=np.zeros(1), y=np.zeros(1), z=np.zeros(1), G_x=np.zeros(1), G_y=np.zeros(1),
+                                      G_z=np.ones(1), names='o', name_id_map={'o': i})
+        for i in (1, 4)
+    ]
+    given_groups = list(orientations_groups)
+
+    # * The empty groups are inserted at their id in ascending id order, into a new list
+    filled = OrientationsTable.fill_missing_orientations_groups(orientations_groups, surface_points_groups)
+    assert [len(group) for group in filled] == [0, 1, 0, 0, 1, 0]
+    assert filled[1] is given_groups[0] and filled[4] is given_groups[1]
+    assert all(group is given for group, given in zip(orientations_groups, given_groups, strict=True))
+
+    # * Nothing is missing
+    assert OrientationsTable.fill_missing_orientations_groups(filled, surface_points_groups) is filled
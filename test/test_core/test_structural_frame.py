@@ -0,0 +1,125 @@
+import numpy as np
+
+from gempy.core.data import (
+    StructuralFrame, StructuralGroup, StructuralElement, SurfacePointsTable, OrientationsTable, ColorsGenerator,
+    StackRelationType, FaultsRelationSpecialCase
+)
+
+
+def _create_element(name: str, n_points: int, n_orientations: int, color_generator: ColorsGenerator) -> StructuralElement:
+    return StructuralElement(
+        name=name,
+        surface_points=SurfacePointsTable.from_arrays(
+            x=np.arange(n_points, dtype=float), y=np.zeros(n_points), z=np.zeros(n_points), names=name
+        ),
+        orientations=OrientationsTable.from_arrays(
+            x=np.zeros(n_orientations), y=np.zeros(n_orientations), z=np.zeros(n_orientations),
+            G_x=np.zeros(n_orientations), G_y=np.zeros(n_orientations), G_z=np.ones(n_orientations), names=name
+        ),
+        color=next(color_generator)
+    )
+
+
+def _create_frame() -> StructuralFrame:
+    color_generator = ColorsGenerator()
+    fault_group = StructuralGroup(
+        name="fault_series",
+        elements=[_create_element("fault", 2, 1, color_generator)],
+        structural_relation=StackRelationType.FAULT,
+        fault_relations=FaultsRelationSpecialCase.OFFSET_ALL
+    )
+    strat_group_1 = StructuralGroup(
+        name="strat_series_1",
+        elements=[_create_element("rock3", 3, 1, color_generator)],
+        structural_relation=StackRelationType.ERODE
+    )
+    strat_group_2 = StructuralGroup(
+        name="strat_series_2",
+        elements=[_create_element("rock2", 4, 2, color_generator), _create_element("rock1", 5, 0, color_generator)],
+        structural_relation=StackRelationType.ERODE
+    )
+    return StructuralFrame(structural_groups=[fault_group, strat_group_1, strat_group_2], color_gen=color_generator)
+
+
+def test_structural_frame_element_edits():
+    frame = _create_frame()
+    assert frame.elements_names == ["fault", "rock3", "rock2", "rock1", "basement"]
+    np.testing.assert_array_equal(frame.number_of_points_per_element, [2, 3, 4, 5, 0])
+    np.testing.assert_array_equal(frame.number_of_points_per_group, [2, 3, 9])
+    np.testing.assert_array_equal(frame.number_of_orientations_per_group, [1, 1, 2])
+    np.testing.assert_array_equal(frame.number_of_elements_per_group, [1, 1, 2])
+
+    # * Elements appended to a group in place
+    frame.structural_groups[1].elements.append(_create_element("rock4", 6, 3, frame.color_generator))
+    assert frame.elements_names == ["fault", "rock3", "rock4", "rock2", "rock1", "basement"]
+    np.testing.assert_array_equal(frame.number_of_points_per_element, [2, 3, 6, 4, 5, 0])
+    np.testing.assert_array_equal(frame.number_of_points_per_group, [2, 9, 9])
+    np.testing.assert_array_equal(frame.number_of_orientations_per_group, [1, 4, 2])
+    np.testing.assert_array_equal(frame.number_of_elements_per_group, [1, 2, 2])
+
+    # * Renamed element
+    rock4 = frame.get_element_by_name("rock4")
+    rock4.name = "renamed"
+    assert frame.elements_names == ["fault", "rock3", "renamed", "rock2", "rock1", "basement"]
+    assert frame.element_name_id_map["renamed"] == rock4.id
+
+    # * Recolored element
+    rock4.color = "#123456"
+    assert frame.elements_colors[::-1][2] == "#123456"
+    assert frame.structural_elements[2].color == "#123456"
+
+    # * Replaced surface points of an element
+    rock4.surface_points.data = np.zeros(1, dtype=SurfacePointsTable.dt)
+    np.testing.assert_array_equal(frame.number_of_points_per_element, [2, 3, 1, 4, 5, 0])
+    np.testing.assert_array_equal(frame.number_of_points_per_group, [2, 4, 9])
+    assert len(frame.surface_points_copy) == 15
+
+
+def test_structural_frame_fault_relations_edits():
+    frame = _create_frame()
+    np.testing.assert_array_equal(frame.fault_relations, [[0, 1, 1], [0, 0, 0], [0, 0, 0]])
+
+    # * Structural relation of a group
+    frame.structural_groups[1].structural_relation = StackRelationType.FAULT
+    frame.structural_groups[1].fault_relations = FaultsRelationSpecialCase.OFFSET_ALL
+    np.testing.assert_array_equal(frame.fault_relations, [[0, 1, 1], [0, 0, 1], [0, 0, 0]])
+
+    # * Fault relations of a group
+    frame.structural_groups[0].fault_relations = FaultsRelationSpecialCase.OFFSET_FORMATIONS
+    np.testing.assert_array_equal(frame.fault_relations, [[0, 0, 1], [0, 0, 1], [0, 0, 0]])
+    frame.structural_groups[1].fault_relations = FaultsRelationSpecialCase.OFFSET_NONE
+    np.testing.assert_array_equal(frame.fault_relations, [[0, 0, 1], [0, 0, 0], [0, 0, 0]])
+
+    frame.structural_groups[0].structural_relation = StackRelationType.ERODE
+    np.testing.assert_array_equal(frame.fault_relations, np.zeros((3, 3)))
+
+    # * Popped group
+    frame.structural_groups[0].structural_relation = StackRelationType.FAULT
+    frame.structural_groups[0].fault_relations = FaultsRelationSpecialCase.OFFSET_ALL
+    frame.structural_groups.pop(1)
+    np.testing.assert_array_equal(frame.fault_relations, [[0, 1], [0, 0]])
+    assert frame.elements_names == ["fault", "rock2", "rock1", "basement"]
+    np.testing.assert_array_equal(frame.number_of_points_per_group, [2, 9])
+    np.testing.assert_array_equal(frame.number_of_elements_per_group, [1, 2])
+
+
+def test_structural_frame_fault_relations_setter():
+    frame = _create_frame()
+    fault_group, strat_group_1, strat_group_2 = frame.structural_groups
+    strat_group_1.structural_relation = StackRelationType.FAULT
+
+    # * Each row is reduced to the special cases when it affects all or none of the younger groups
+    frame.fault_relations = np.array([[0, 1, 1], [0, 0, 0], [0, 0, 0]])
+    assert fault_group.fault_relations is FaultsRelationSpecialCase.OFFSET_ALL
+    assert strat_group_1.fault_relations is FaultsRelationSpecialCase.OFFSET_NONE
+    np.testing.assert_array_equal(frame.fault_relations, [[0, 1, 1], [0, 0, 0], [0, 0, 0]])
+
+    # * And to the list of affected groups otherwise
+    frame.fault_relations = np.array([[0, 1, 0], [0, 0, 1], [0, 0, 0]])
+    assert fault_group.fault_relations == [strat_group_1]
+    assert strat_group_1.fault_relations is FaultsRelationSpecialCase.OFFSET_ALL
+
+    frame.fault_relations = np.zeros((3, 3))
+    assert fault_group.fault_relations is FaultsRelationSpecialCase.OFFSET_NONE
+    assert strat_group_1.fault_relations is FaultsRelationSpecialCase.OFFSET_NONE
+    np.testing.assert_array_equal(frame.fault_relations, np.zeros((3, 3)))